@@ -20,21 +20,48 @@ The server provides:
 
 # Import necessary libraries for the HTTP server
 from fastapi import FastAPI, HTTPException  # FastAPI framework for building REST APIs
+from fastapi.responses import Response  # Raw responses for prebuilt JSON bytes
 from pydantic import BaseModel  # Data validation and serialization using Python type annotations
 import asyncio  # Asynchronous I/O support (for future async operations)
-import json  # JSON encoding and decoding
+import anyio.to_thread  # Threadpool used by Starlette to run sync endpoints
+from collections import Counter  # Fast C-implemented element counting
+from contextlib import asynccontextmanager  # Application startup/shutdown lifecycle
+from functools import lru_cache  # Memoization for deterministic computations
 import math  # Mathematical functions
-import statistics  # Statistical functions
-from typing import Any, Dict, List, Optional, Union  # Type hints for better code documentation
+import os  # Operating system utilities (CPU count for worker processes)
+from typing import Any, Dict, List, Optional, Sequence, Union  # Type hints for better code documentation
 from datetime import datetime  # Date and time utilities
 import re  # Regular expressions for pattern matching
+import time  # Monotonic clock for cache expiry
+import gmpy2  # GMP-backed big-integer math (fast factorials)
+import numpy as np  # Vectorized numerical computing
+import orjson  # Fast JSON serialization
 import uvicorn  # ASGI server for running FastAPI applications
 
+# Optional: Numba JIT compiler used to accelerate character counting in text analysis
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the server on startup.
+    
+    The CPU-bound math and text endpoints are plain ``def`` functions, which
+    Starlette runs in a worker threadpool so they don't block the event loop.
+    The pool is raised from its default of 40 threads to handle more
+    concurrent requests.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 128
+    yield
+
 # Create FastAPI application instance with metadata
 app = FastAPI(
     title="MCP Math-Text-Analysis HTTP Server",  # API title shown in documentation
     description="HTTP wrapper for MCP server functionality",  # API description
-    version="1.0.0"  # API version for versioning and compatibility tracking
+    version="1.0.0",  # API version for versioning and compatibility tracking
+    lifespan=lifespan  # Startup configuration (threadpool size)
 )
 
 # Pydantic models for request/response validation and documentation
@@ -69,13 +96,17 @@ class TextRequest(BaseModel):
 class MathResponse(BaseModel):
     """Response model for mathematical operations.
     
+    Used to document the response schema only; responses are built as plain
+    dicts and serialized with orjson without being re-validated.
+    
     Attributes:
-        result: The calculated result (can be various types depending on operation)
+        result: The calculated result (can be various types depending on operation;
+            None for a failed item of a batch request)
         operation: Echo of the operation that was performed
         success: Boolean indicating if operation completed successfully
         message: Optional error or informational message
     """
-    result: Union[float, List[float], str, Dict[str, Any]]  # Flexible result type
+    result: Optional[Union[float, List[float], str, Dict[str, Any]]]  # Flexible result type
     operation: str  # Echo of the requested operation
     success: bool  # Success indicator
     message: Optional[str] = None  # Optional message for additional info
@@ -83,13 +114,16 @@ class MathResponse(BaseModel):
 class TextResponse(BaseModel):
     """Response model for text processing operations.
     
+    Used to document the response schema only; responses are built as plain
+    dicts and serialized with orjson without being re-validated.
+    
     Attributes:
-        result: The processed text result
+        result: The processed text result (string for transforms, dict/list for analysis/extraction)
         operation: Echo of the operation that was performed
         success: Boolean indicating if operation completed successfully
         message: Optional error or informational message
     """
-    result: str  # Text processing result
+    result: Union[str, Dict[str, Any], List[str]]  # Text processing result
     operation: str  # Echo of the requested operation
     success: bool  # Success indicator
     message: Optional[str] = None  # Optional message for additional info
@@ -97,7 +131,7 @@ class TextResponse(BaseModel):
 # Mathematical operation functions
 # These functions implement the core mathematical capabilities of the MCP server
 
-def calculate_statistics(values: List[float]) -> Dict[str, float]:
+def calculate_statistics(values: Sequence[float]) -> Dict[str, float]:
     """Calculate comprehensive statistics for a dataset.
     
     This function computes various statistical measures including:
@@ -115,26 +149,64 @@ def calculate_statistics(values: List[float]) -> Dict[str, float]:
         HTTPException: If calculation fails due to invalid input
     """
     try:
+        if not values:
+            raise ValueError("statistics require at least one data point")
+        
+        # Convert once to a contiguous float64 array so every measure runs as a vectorized C loop
+        arr = np.asarray(values, dtype=np.float64)
+        count = arr.size
+        min_value = float(arr.min())
+        max_value = float(arr.max())
+        
+        # Unique values with their counts and first positions (sorted once, in C)
+        unique_values, first_index, counts = np.unique(arr, return_index=True, return_counts=True)
+        mode = None
+        # Mode only exists if there are repeated values
+        if unique_values.size < count:
+            # Among equally common values pick the first one seen, matching statistics.mode
+            most_common = counts == counts.max()
+            mode = float(unique_values[most_common][np.argmin(first_index[most_common])])
+        
         # Calculate all statistical measures
         result = {
-            "count": len(values),  # Number of data points
-            "mean": statistics.mean(values),  # Arithmetic average
-            "median": statistics.median(values),  # Middle value when sorted
-            # Mode only exists if there are repeated values
-            "mode": statistics.mode(values) if len(set(values)) < len(values) else None,
+            "count": count,  # Number of data points
+            "mean": float(arr.mean()),  # Arithmetic average
+            "median": float(np.median(arr)),  # Middle value when sorted
+            "mode": mode,  # Most common value (None when all values are distinct)
             # Standard deviation and variance require at least 2 values
-            "std_dev": statistics.stdev(values) if len(values) > 1 else 0.0,
-            "variance": statistics.variance(values) if len(values) > 1 else 0.0,
-            "min": min(values),  # Minimum value
-            "max": max(values),  # Maximum value
-            "range": max(values) - min(values),  # Difference between max and min
-            "sum": sum(values)  # Sum of all values
+            "std_dev": float(arr.std(ddof=1)) if count > 1 else 0.0,
+            "variance": float(arr.var(ddof=1)) if count > 1 else 0.0,
+            "min": min_value,  # Minimum value
+            "max": max_value,  # Maximum value
+            "range": max_value - min_value,  # Difference between max and min
+            "sum": float(arr.sum())  # Sum of all values
         }
         return result
     except Exception as e:
         # Convert any calculation error to HTTP exception
         raise HTTPException(status_code=400, detail=f"Error calculating statistics: {str(e)}")
 
+# Datasets longer than this are not memoized: building and hashing the key costs about as much
+# as recomputing, and large entries would pin a lot of memory in the cache
+_STATS_CACHE_MAX_VALUES = 256
+
+# Memoized statistics for repeated datasets (call with a tuple so the values are hashable)
+_calculate_statistics_cached = lru_cache(maxsize=1024)(calculate_statistics)
+
+def calculate_statistics_cached(values: Sequence[float]) -> Dict[str, float]:
+    """Calculate statistics, reusing earlier results for repeated small datasets.
+    
+    Args:
+        values: Sequence of numeric values to analyze
+        
+    Returns:
+        Dictionary containing all calculated statistics (shared with the cache, do not modify)
+    """
+    if len(values) > _STATS_CACHE_MAX_VALUES:
+        return calculate_statistics(values)
+    return _calculate_statistics_cached(tuple(values))
+
+@lru_cache(maxsize=4096)  # Same coefficients always yield the same roots
 def solve_quadratic(a: float, b: float, c: float) -> Dict[str, Any]:
     """Solve quadratic equation ax² + bx + c = 0.
     
@@ -196,11 +268,14 @@ def solve_quadratic(a: float, b: float, c: float) -> Dict[str, Any]:
         # Handle division by zero (a=0) and other mathematical errors
         raise HTTPException(status_code=400, detail=f"Error solving quadratic: {str(e)}")
 
-def advanced_math_operations(operation: str, values: List[float], **kwargs) -> Union[float, Dict]:
+# Largest n accepted by the factorial operation (limits CPU time and response size)
+MAX_FACTORIAL_N = int(os.getenv("MCP_MAX_FACTORIAL_N", "100000"))
+
+def advanced_math_operations(operation: str, values: List[float], **kwargs) -> Union[float, str, Dict]:
     """Perform various advanced mathematical operations.
     
     Supports multiple mathematical functions:
-    - factorial: Calculate n! for non-negative integers
+    - factorial: Calculate n! for non-negative integers (returned as a string)
     - logarithm: Natural log or log with custom base
     - trigonometry: Sin, cos, tan for angles in radians
     - power: Calculate base^exponent
@@ -211,7 +286,8 @@ def advanced_math_operations(operation: str, values: List[float], **kwargs) -> U
         **kwargs: Additional keyword arguments (unused but allows flexibility)
         
     Returns:
-        Either a single float result or a dictionary with multiple results
+        A single float result, the digits of a factorial as a string,
+        or a dictionary with multiple results
         
     Raises:
         HTTPException: If operation is invalid or calculation fails
@@ -221,7 +297,13 @@ def advanced_math_operations(operation: str, values: List[float], **kwargs) -> U
             # Factorial requires exactly one non-negative integer
             if len(values) != 1 or values[0] < 0 or values[0] != int(values[0]):
                 raise ValueError("Factorial requires a single non-negative integer")
-            return math.factorial(int(values[0]))
+            n = int(values[0])
+            if n > MAX_FACTORIAL_N:
+                raise ValueError(f"Factorial input must not exceed {MAX_FACTORIAL_N}")
+            # gmpy2 uses binary splitting with GMP's optimized multiplication, far faster than
+            # math.factorial for large n, and converts to a string without Python's 4300-digit limit.
+            # Returned as a string: JSON numbers can't hold arbitrarily large integers exactly
+            return str(gmpy2.fac(n))
         
         elif operation == "logarithm":
             # Support both natural log and custom base logarithm
@@ -264,6 +346,56 @@ def advanced_math_operations(operation: str, values: List[float], **kwargs) -> U
 # Text processing functions
 # These functions provide comprehensive text analysis and manipulation capabilities
 
+# A sentence: text between . ! ? terminators containing at least one non-whitespace character
+# (each match starts at the first visible character and runs up to the next terminator)
+_SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*')
+
+# Translation table deleting the punctuation ignored when measuring word lengths
+_WORD_PUNCTUATION_TABLE = str.maketrans('', '', '.,!?;:"()[]{}')
+
+# Byte lookup table for the compiled character scan; columns are
+# [not a space, uppercase, lowercase, digit, special] and match the str methods used for non-ASCII text
+_CHAR_CLASS_LUT = np.zeros((256, 5), dtype=np.uint8)
+for _code in range(128):
+    _char = chr(_code)
+    _CHAR_CLASS_LUT[_code] = [
+        _char != ' ',
+        _char.isupper(),
+        _char.islower(),
+        _char.isdigit(),
+        not _char.isalnum() and not _char.isspace()
+    ]
+del _code, _char
+
+if njit is not None:
+    @njit(cache=True)
+    def _count_char_classes(buf, class_lut):
+        """Count the characters of each class in a single pass over ASCII bytes.
+        
+        Args:
+            buf: ASCII text as a uint8 array
+            class_lut: 256 x k table marking each byte's class membership
+            
+        Returns:
+            Array with the number of bytes in each of the k classes
+        """
+        num_classes = class_lut.shape[1]
+        counts = np.zeros(num_classes, dtype=np.int64)
+        for i in range(buf.size):
+            row = class_lut[buf[i]]
+            for k in range(num_classes):
+                counts[k] += row[k]
+        return counts
+    
+    # Compile (or load from the on-disk cache) at import so the first request doesn't pay for JIT
+    try:
+        _count_char_classes(np.frombuffer(b"Warm up 1!", dtype=np.uint8), _CHAR_CLASS_LUT)
+    except Exception:
+        # Compilation or a stale cache entry failed: use the Counter path instead
+        _count_char_classes = None
+else:
+    _count_char_classes = None
+
 def analyze_text(text: str) -> Dict[str, Any]:
     """Comprehensive text analysis providing detailed metrics and insights.
     
@@ -285,35 +417,59 @@ def analyze_text(text: str) -> Dict[str, Any]:
     try:
         # Basic text segmentation
         words = text.split()  # Split on whitespace to get words
-        sentences = text.split('.')  # Split on periods to estimate sentences
-        sentences = [s.strip() for s in sentences if s.strip()]  # Remove empty sentences
+        # Count sentences by scanning for them instead of materializing a list of split pieces
+        sentence_count = sum(1 for _ in _SENTENCE_RE.finditer(text))
         
         # Character-level analysis
+        if _count_char_classes is not None and text.isascii():
+            # Pure ASCII: count every category in one compiled pass over the bytes
+            buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+            no_spaces, uppercase, lowercase, digits, special = _count_char_classes(buf, _CHAR_CLASS_LUT).tolist()
+        else:
+            # Count each distinct character once in C, then classify the (few) unique characters
+            char_freq = Counter(text)
+            no_spaces = len(text) - char_freq.get(' ', 0)
+            uppercase = sum(n for c, n in char_freq.items() if c.isupper())
+            lowercase = sum(n for c, n in char_freq.items() if c.islower())
+            digits = sum(n for c, n in char_freq.items() if c.isdigit())
+            special = sum(n for c, n in char_freq.items() if not c.isalnum() and not c.isspace())
+        
         char_counts = {
             'total_chars': len(text),  # Total character count including spaces
-            'chars_no_spaces': len(text.replace(' ', '')),  # Characters excluding spaces
-            'uppercase': sum(1 for c in text if c.isupper()),  # Count uppercase letters
-            'lowercase': sum(1 for c in text if c.islower()),  # Count lowercase letters
-            'digits': sum(1 for c in text if c.isdigit()),  # Count numeric digits
-            # Count special characters (not alphanumeric or whitespace)
-            'special_chars': sum(1 for c in text if not c.isalnum() and not c.isspace())
+            'chars_no_spaces': no_spaces,  # Characters excluding spaces
+            'uppercase': uppercase,  # Count uppercase letters
+            'lowercase': lowercase,  # Count lowercase letters
+            'digits': digits,  # Count numeric digits
+            'special_chars': special  # Count special characters (not alphanumeric or whitespace)
         }
         
         # Word length analysis (remove common punctuation for accurate length)
-        word_lengths = [len(word.strip('.,!?;:"()[]{}')) for word in words]
-        avg_word_length = sum(word_lengths) / len(word_lengths) if word_lengths else 0
+        # A single C-level translate over all words replaces a per-word strip() call
+        word_chars = len(''.join(words).translate(_WORD_PUNCTUATION_TABLE))
+        avg_word_length = word_chars / len(words) if words else 0
+        
+        # Track longest/shortest by raw length; strict comparisons keep the first one found
+        longest_word = shortest_word = ""
+        longest_len = -1
+        shortest_len = math.inf
+        for word in words:
+            word_len = len(word)
+            if word_len > longest_len:
+                longest_word, longest_len = word, word_len
+            if word_len < shortest_len:
+                shortest_word, shortest_len = word, word_len
         
         # Compile comprehensive analysis results
         return {
             'word_count': len(words),  # Total number of words
-            'sentence_count': len(sentences),  # Estimated sentence count
-            'paragraph_count': len(text.split('\n\n')),  # Count paragraphs (double newlines)
+            'sentence_count': sentence_count,  # Estimated sentence count
+            'paragraph_count': text.count('\n\n') + 1,  # Count paragraphs (double newlines)
             'avg_word_length': round(avg_word_length, 2),  # Average characters per word
             # Average words per sentence
-            'avg_sentence_length': round(len(words) / len(sentences), 2) if sentences else 0,
+            'avg_sentence_length': round(len(words) / sentence_count, 2) if sentence_count else 0,
             'character_analysis': char_counts,  # Detailed character breakdown
-            'longest_word': max(words, key=len) if words else "",  # Longest word found
-            'shortest_word': min(words, key=len) if words else ""  # Shortest word found
+            'longest_word': longest_word,  # Longest word found
+            'shortest_word': shortest_word  # Shortest word found
         }
     except Exception as e:
         # Convert any analysis error to HTTP exception
@@ -348,6 +504,9 @@ def transform_text(text: str, transformation: str) -> str:
             return text.lower()
         elif transformation == "title":
             # Convert to title case (first letter of each word capitalized)
+            if text.isascii():
+                # ASCII fast path: bytes.title skips the Unicode case database and gives identical results
+                return text.encode('ascii').title().decode('ascii')
             return text.title()
         elif transformation == "reverse":
             # Reverse the entire string character by character
@@ -400,6 +559,25 @@ def transform_text(text: str, transformation: str) -> str:
         # Convert any transformation error to HTTP exception
         raise HTTPException(status_code=400, detail=f"Error transforming text: {str(e)}")
 
+# Precompiled regular expression patterns for information extraction
+# Compiling once at import time avoids re-parsing the patterns on every request
+_EXTRACT_PATTERNS = {
+    # Email pattern: matches standard email format (user@domain.tld)
+    "emails": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    
+    # URL pattern: matches HTTP and HTTPS URLs
+    "urls": re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'),
+    
+    # US phone number pattern: matches various formats like (555) 123-4567, 555-123-4567, etc.
+    "phone_numbers": re.compile(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b'),
+    
+    # Date pattern: matches MM/DD/YYYY, DD-MM-YYYY, YYYY/MM/DD formats
+    "dates": re.compile(r'\b(?:\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2})\b'),
+    
+    # Number pattern: matches integers and decimal numbers
+    "numbers": re.compile(r'\b\d+(?:\.\d+)?\b')
+}
+
 def extract_information(text: str, extraction_type: str) -> List[str]:
     """Extract specific types of information from text using regex patterns.
     
@@ -421,47 +599,140 @@ def extract_information(text: str, extraction_type: str) -> List[str]:
         HTTPException: If extraction type is invalid or processing fails
     """
     try:
-        # Regular expression patterns for different information types
-        patterns = {
-            # Email pattern: matches standard email format (user@domain.tld)
-            "emails": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            
-            # URL pattern: matches HTTP and HTTPS URLs
-            "urls": r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+',
-            
-            # US phone number pattern: matches various formats like (555) 123-4567, 555-123-4567, etc.
-            "phone_numbers": r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b',
-            
-            # Date pattern: matches MM/DD/YYYY, DD-MM-YYYY, YYYY/MM/DD formats
-            "dates": r'\b(?:\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\d{4}[/-]\d{1,2}[/-]\d{1,2})\b',
-            
-            # Number pattern: matches integers and decimal numbers
-            "numbers": r'\b\d+(?:\.\d+)?\b'
-        }
+        # Look up the precompiled pattern for the requested information type
+        pattern = _EXTRACT_PATTERNS.get(extraction_type)
         
         # Validate that the requested extraction type exists
-        if extraction_type not in patterns:
-            available_types = ', '.join(patterns.keys())
+        if pattern is None:
+            available_types = ', '.join(_EXTRACT_PATTERNS.keys())
             raise ValueError(f"Unknown extraction type '{extraction_type}'. Available: {available_types}")
         
-        # Find all matches using the appropriate regex pattern
-        matches = re.findall(patterns[extraction_type], text)
-        
-        # Special handling for phone numbers (regex returns tuples for grouped captures)
+        # Special handling for phone numbers (the regex captures area code, prefix and line number)
         if extraction_type == "phone_numbers":
-            # Phone number regex uses capture groups, so format the tuples into readable strings
-            formatted_matches = [f"({match[0]}) {match[1]}-{match[2]}" for match in matches]
-            return formatted_matches
+            # Format each match straight from its groups, without an intermediate list of tuples
+            return [f"({match[1]}) {match[2]}-{match[3]}" for match in pattern.finditer(text)]
         else:
-            # Other patterns return simple string matches
-            return matches
+            # Other patterns have no capture groups, so findall builds the list of strings in one C pass
+            return pattern.findall(text)
     except Exception as e:
         # Convert any extraction error to HTTP exception
         raise HTTPException(status_code=400, detail=f"Error extracting information: {str(e)}")
 
+# Texts longer than this are not memoized, to bound the memory held by the cache
+_EXTRACT_CACHE_MAX_CHARS = 64 * 1024
+
+# Memoized extraction for repeated texts
+_extract_information_cached = lru_cache(maxsize=1024)(extract_information)
+
+def extract_information_cached(text: str, extraction_type: str) -> List[str]:
+    """Extract information, reusing earlier results for repeated small texts.
+    
+    Args:
+        text: The input text to search for patterns
+        extraction_type: The type of information to extract
+        
+    Returns:
+        List of strings containing all matches found (shared with the cache, do not modify)
+    """
+    if len(text) > _EXTRACT_CACHE_MAX_CHARS:
+        # Large texts are rarely repeated and would pin a lot of memory in the cache
+        return extract_information(text, extraction_type)
+    return _extract_information_cached(text, extraction_type)
+
+def run_math_operation(request: MathRequest) -> Any:
+    """Dispatch a math request to the function implementing its operation.
+    
+    Args:
+        request: MathRequest containing operation type and required parameters
+        
+    Returns:
+        The calculation result for the requested operation
+        
+    Raises:
+        HTTPException: If operation is invalid or calculation fails
+    """
+    if request.operation == "statistics":
+        # Calculate comprehensive statistics for the provided values
+        return calculate_statistics_cached(request.values)
+    
+    elif request.operation == "quadratic":
+        # Solve quadratic equation - requires all three coefficients
+        if request.a is None or request.b is None or request.c is None:
+            raise HTTPException(status_code=400, detail="Quadratic equation requires a, b, c coefficients")
+        return solve_quadratic(request.a, request.b, request.c)
+    
+    elif request.operation in ["factorial", "logarithm", "trigonometry", "power"]:
+        # Handle advanced mathematical operations
+        return advanced_math_operations(request.operation, request.values)
+    
+    else:
+        # Unknown mathematical operation requested
+        raise HTTPException(status_code=400, detail=f"Unknown math operation: {request.operation}")
+
+def success_payload(result: Any, operation: str) -> Dict[str, Any]:
+    """Build the payload for a successful operation in the MathResponse/TextResponse shape.
+    
+    Args:
+        result: The operation result (any orjson-serializable value)
+        operation: Echo of the operation that was performed
+        
+    Returns:
+        Dictionary with result, operation, success and message fields
+    """
+    return {"result": result, "operation": operation, "success": True, "message": None}
+
+def json_response(content: Any, pretty: bool = False) -> Response:
+    """Serialize content with orjson into a raw JSON response.
+    
+    Bypasses FastAPI's response_model handling, which would validate the
+    payload into a Pydantic model before serializing it. The response models
+    are referenced through ``responses=`` only, so the OpenAPI schema is unchanged.
+    
+    Args:
+        content: Any orjson-serializable value
+        pretty: Indent the JSON for human reading (compact output is the fast default)
+        
+    Returns:
+        Response with the encoded JSON body
+    """
+    option = orjson.OPT_INDENT_2 if pretty else None
+    return Response(content=orjson.dumps(content, option=option), media_type="application/json")
+
+def success_response(result: Any, operation: str, pretty: bool = False) -> Response:
+    """Build a successful operation response without Pydantic output validation.
+    
+    Args:
+        result: The operation result (any orjson-serializable value)
+        operation: Echo of the operation that was performed
+        pretty: Indent the JSON for human reading (compact output is the fast default)
+        
+    Returns:
+        JSON response in the MathResponse/TextResponse shape
+    """
+    return json_response(success_payload(result, operation), pretty)
+
 # HTTP API Endpoints
 # These endpoints expose the MCP server functionality via REST API
 
+# The root response is fully static, so it is serialized once at import time
+_ROOT_BYTES = orjson.dumps({
+    "name": "MCP Math-Text-Analysis HTTP Server",
+    "version": "1.0.0",
+    "description": "HTTP wrapper for MCP server functionality",
+    "endpoints": {
+        "math": "/math",  # Mathematical operations endpoint
+        "math_batch": "/math/batch",  # Batched mathematical operations endpoint
+        "text": "/text",  # Text processing operations endpoint
+        "health": "/health"  # Health check endpoint
+    }
+})
+
+# Fixed start of the health check JSON; only the timestamp is filled in per request
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+
+# Formatted health timestamp reused for up to a second: [monotonic time of refresh, ISO timestamp bytes]
+_HEALTH_TIMESTAMP_CACHE = [-math.inf, b""]
+
 @app.get("/")
 async def root():
     """Root endpoint providing server information and available endpoints.
@@ -470,18 +741,9 @@ async def root():
     endpoints for API discovery and documentation purposes.
     
     Returns:
-        Dictionary with server metadata and endpoint information
+        Prebuilt JSON response with server metadata and endpoint information
     """
-    return {
-        "name": "MCP Math-Text-Analysis HTTP Server",
-        "version": "1.0.0",
-        "description": "HTTP wrapper for MCP server functionality",
-        "endpoints": {
-            "math": "/math",  # Mathematical operations endpoint
-            "text": "/text",  # Text processing operations endpoint
-            "health": "/health"  # Health check endpoint
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
@@ -491,12 +753,20 @@ async def health_check():
     and responsive. Useful for load balancers and monitoring systems.
     
     Returns:
-        Dictionary with health status and current timestamp
+        JSON response with health status and current timestamp (1 second resolution)
     """
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    # Reformat the timestamp at most once per second; load balancers may poll this very often
+    now = time.monotonic()
+    if now - _HEALTH_TIMESTAMP_CACHE[0] >= 1.0:
+        _HEALTH_TIMESTAMP_CACHE[:] = [now, datetime.now().isoformat().encode()]
+    return Response(
+        content=_HEALTH_PREFIX + _HEALTH_TIMESTAMP_CACHE[1] + b'"}',
+        media_type="application/json"
+    )
 
-@app.post("/math", response_model=MathResponse)
-async def math_operations(request: MathRequest):
+# Response models are only referenced for the OpenAPI docs, so outgoing payloads skip validation
+@app.post("/math", responses={200: {"model": MathResponse}})
+def math_operations(request: MathRequest):
     """Perform mathematical operations via HTTP POST requests.
     
     Handles various mathematical operations including:
@@ -511,32 +781,14 @@ async def math_operations(request: MathRequest):
         request: MathRequest containing operation type and required parameters
         
     Returns:
-        MathResponse with calculation results and operation metadata
+        JSON response with calculation results and operation metadata (MathResponse schema)
         
     Raises:
         HTTPException: If operation is invalid or calculation fails
     """
     try:
-        if request.operation == "statistics":
-            # Calculate comprehensive statistics for the provided values
-            result = calculate_statistics(request.values)
-            return MathResponse(result=result, operation=request.operation, success=True)
-        
-        elif request.operation == "quadratic":
-            # Solve quadratic equation - requires all three coefficients
-            if request.a is None or request.b is None or request.c is None:
-                raise HTTPException(status_code=400, detail="Quadratic equation requires a, b, c coefficients")
-            result = solve_quadratic(request.a, request.b, request.c)
-            return MathResponse(result=result, operation=request.operation, success=True)
-        
-        elif request.operation in ["factorial", "logarithm", "trigonometry", "power"]:
-            # Handle advanced mathematical operations
-            result = advanced_math_operations(request.operation, request.values)
-            return MathResponse(result=result, operation=request.operation, success=True)
-        
-        else:
-            # Unknown mathematical operation requested
-            raise HTTPException(status_code=400, detail=f"Unknown math operation: {request.operation}")
+        result = run_math_operation(request)
+        return success_response(result, request.operation)
     
     except HTTPException:
         # Re-raise HTTP exceptions (already properly formatted)
@@ -545,8 +797,45 @@ async def math_operations(request: MathRequest):
         # Convert unexpected errors to HTTP exceptions
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
-@app.post("/text", response_model=TextResponse)
-async def text_operations(request: TextRequest):
+# Largest number of requests accepted by /math/batch
+MAX_MATH_BATCH_SIZE = int(os.getenv("MCP_MAX_MATH_BATCH_SIZE", "100"))
+
+@app.post("/math/batch", responses={200: {"model": List[MathResponse]}})
+def math_batch_operations(requests: List[MathRequest]):
+    """Perform several mathematical operations in a single HTTP POST request.
+    
+    Accepts a list of the same requests handled by /math, so the per-request
+    HTTP and validation overhead is paid once for the whole batch. Each item
+    goes through the same dispatch as /math and returns identical results.
+    
+    Args:
+        requests: List of MathRequest objects (at most MAX_MATH_BATCH_SIZE)
+        
+    Returns:
+        JSON list with one MathResponse-shaped result per request, in order;
+        a failed item has success=False and the error in its message
+        
+    Raises:
+        HTTPException: If the batch exceeds MAX_MATH_BATCH_SIZE items
+    """
+    # Bound the work a single request can queue (e.g. many large factorials)
+    if len(requests) > MAX_MATH_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Batch size must not exceed {MAX_MATH_BATCH_SIZE} requests")
+    
+    results = []
+    for request in requests:
+        try:
+            results.append(success_payload(run_math_operation(request), request.operation))
+        except HTTPException as e:
+            # Report the error for this item without failing the whole batch
+            results.append({"result": None, "operation": request.operation, "success": False, "message": e.detail})
+        except Exception as e:
+            results.append({"result": None, "operation": request.operation, "success": False, "message": f"Internal error: {str(e)}"})
+    
+    return json_response(results)
+
+@app.post("/text", responses={200: {"model": TextResponse}})
+def text_operations(request: TextRequest, pretty: bool = False):
     """Perform text processing operations via HTTP POST requests.
     
     Handles various text processing operations including:
@@ -556,9 +845,10 @@ async def text_operations(request: TextRequest):
     
     Args:
         request: TextRequest containing text, operation type, and optional parameters
+        pretty: Query parameter (?pretty=1) to indent the JSON output for debugging
         
     Returns:
-        TextResponse with processing results and operation metadata
+        JSON response with processing results and operation metadata (TextResponse schema)
         
     Raises:
         HTTPException: If operation is invalid or processing fails
@@ -567,23 +857,23 @@ async def text_operations(request: TextRequest):
         if request.operation == "analyze":
             # Perform comprehensive text analysis
             result = analyze_text(request.text)
-            # Convert result to JSON string for consistent response format
-            return TextResponse(result=json.dumps(result, indent=2), operation=request.operation, success=True)
+            # Return the analysis dict directly; it is serialized once by orjson
+            return success_response(result, request.operation, pretty)
         
         elif request.operation == "transform":
             # Transform text using specified transformation type
             if not request.extraction_type:
                 raise HTTPException(status_code=400, detail="Transform operation requires transformation type")
             result = transform_text(request.text, request.extraction_type)
-            return TextResponse(result=result, operation=request.operation, success=True)
+            return success_response(result, request.operation, pretty)
         
         elif request.operation == "extract":
             # Extract specific information patterns from text
             if not request.extraction_type:
                 raise HTTPException(status_code=400, detail="Extract operation requires extraction type")
-            result = extract_information(request.text, request.extraction_type)
-            # Convert list result to JSON string for consistent response format
-            return TextResponse(result=json.dumps(result, indent=2), operation=request.operation, success=True)
+            result = extract_information_cached(request.text, request.extraction_type)
+            # Return the list of matches directly; it is serialized once by orjson
+            return success_response(result, request.operation, pretty)
         
         else:
             # Unknown text processing operation requested
@@ -608,4 +898,17 @@ if __name__ == "__main__":
     # host="0.0.0.0" allows connections from any IP (useful for containerization)
     # port=8000 is the default port for the HTTP server
     # log_level="info" provides detailed logging for debugging and monitoring
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
+    # loop="auto" and http="auto" pick uvloop and httptools from uvicorn[standard] when installed
+    # (uvloop isn't available on Windows, where the asyncio loop is used instead)
+    # workers=os.cpu_count() runs one process per core so CPU-bound math isn't limited by the GIL
+    # (multiple workers require the app to be passed as an "module:attribute" import string)
+    uvicorn.run(
+        f"{os.path.splitext(os.path.basename(__file__))[0]}:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        loop="auto",
+        http="auto",
+        workers=os.cpu_count()
+    )
\ No newline at end of file